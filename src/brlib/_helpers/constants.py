@@ -100,11 +100,21 @@ SB_ATTEMPT_REGEX = re.compile(
 PICKOFF_REGEX = re.compile(
     r"(?P<base>1st base|2nd base|3rd base|Home) by (?P<pitcher>\D+)(?P<times>\d?)"
 )
+PARK_FACTORS_REGEX = re.compile(
+    r"(?P<span>Multi|One)-year:\s*Batting - (?P<batting>\d+),\s*Pitching - (?P<pitching>\d+)"
+)
 
 # exponent used when calculating team Pythagorean W-L%
 # see https://www.sports-reference.com/blog/baseball-reference-faqs/
 PYTHAGOREAN_EXPONENT = 1.83
 
+# team bling section elements and their corresponding columns, excluding pennants
+# (e.g., "AL Pennant"), which are identified by their suffix
+TEAM_BLING_ELEMENTS = {
+    "Team Gold Glove": "Team Gold Glove",
+    "World Series Champions": "World Series",
+}
+
 # create a dictionary of team IDs and name replacements that distinguish between teams with the same
 # name and use only one name for teams that did not relocate (split seasons count as relocations)
 TEAM_REPLACEMENTS: dict[str, str] = {}
@@ -1208,3 +1218,17 @@ TEAM_FIELDING_DTYPES = {
     "Team ID": "string",
     "Player ID": "string",
 }
+
+# columns passed through pd.to_numeric when scraping teams; "Age" has a string dtype, but it is
+# converted anyway so that its values keep the same formatting (e.g., "39.0")
+TEAM_INFO_NUMERIC_COLS = frozenset(k for k, v in TEAM_INFO_DTYPES.items() if v != "string")
+TEAM_BLING_NUMERIC_COLS = frozenset(k for k, v in TEAM_BLING_DTYPES.items() if v != "string")
+TEAM_BATTING_NUMERIC_COLS = frozenset(
+    k for k, v in TEAM_BATTING_DTYPES.items() if v != "string" or k == "Age"
+)
+TEAM_PITCHING_NUMERIC_COLS = frozenset(
+    k for k, v in TEAM_PITCHING_DTYPES.items() if v != "string" or k == "Age"
+)
+TEAM_FIELDING_NUMERIC_COLS = frozenset(
+    k for k, v in TEAM_FIELDING_DTYPES.items() if v != "string" or k == "Age"
+)
@@ -1,6 +1,8 @@
 """Defines and instantiates `NoHitterDicts` singleton."""
 
 import os
+import pickle
+import tempfile
 from datetime import datetime
 
 import pandas as pd
@@ -8,7 +10,7 @@ from bs4 import BeautifulSoup as bs
 from bs4 import Tag
 from curl_cffi.requests import Response
 
-from ..options import write
+from ..options import dev_alert, write
 from .constants import (
     BML_TEAM_ABVS,
     CACHE_DIR,
@@ -32,13 +34,28 @@ class NoHitterDicts(Singleton):
     `populate` method. Until this method is called, the dictionaries are empty.
     """
 
+    # names of the dictionary attributes, which are cached together
+    _dict_names = (
+        "game_inh_dict",
+        "game_pg_dict",
+        "game_cnh_dict",
+        "player_inh_dict",
+        "player_pg_dict",
+        "player_cnh_dict",
+        "team_inh_dict",
+        "team_pg_dict",
+        "team_cnh_dict",
+    )
+
     def __init__(self) -> None:
-        self._cache_file = CACHE_DIR / "nh_data_v1.csv"
+        self._cache_file = CACHE_DIR / "nh_dicts_v1.pkl"
+        # raw data cache used by earlier versions, removed once the dictionaries are cached
+        self._legacy_cache_file = CACHE_DIR / "nh_data_v1.csv"
         self._populated = False
 
-        self.game_inh_dict, self.game_pg_dict, self.game_cnh_dict = [{} for _ in range(3)]
-        self.player_inh_dict, self.player_pg_dict, self.player_cnh_dict = [{} for _ in range(3)]
-        self.team_inh_dict, self.team_pg_dict, self.team_cnh_dict = [{} for _ in range(3)]
+        self.game_inh_dict, self.game_pg_dict, self.game_cnh_dict = {}, {}, {}
+        self.player_inh_dict, self.player_pg_dict, self.player_cnh_dict = {}, {}, {}
+        self.team_inh_dict, self.team_pg_dict, self.team_cnh_dict = {}, {}, {}
 
     def populate(self) -> None:
         """
@@ -48,19 +65,18 @@ class NoHitterDicts(Singleton):
         if self._populated:
             return
 
-        if self._has_valid_cache:
-            data_df = self._load()
-        else:
+        loaded = self._has_valid_cache and self._load()
+        if not loaded:
             data_df = self._get()
-
-        assert not data_df.empty
-        self._generate_dicts(data_df)
+            assert not data_df.empty
+            self._generate_dicts(data_df)
+            self._save()
         self._populated = True
 
     @property
     def _has_valid_cache(self) -> bool:
         """
-        Whether cached nh_data.csv is valid, remove invalid cached files.
+        Whether the cached dictionaries are valid, remove invalid cached files.
         If it is the offseason, the cache is valid if it was created during said offseason.
         If it is during the season, the cache is valid if it was created today.
         """
@@ -84,18 +100,48 @@ class NoHitterDicts(Singleton):
         self._cache_file.unlink()
         return False
 
-    def _load(self) -> pd.DataFrame:
-        """Loads no-hitter data from the cache."""
-        data_df = pd.read_csv(self._cache_file)
-        return data_df
+    def _load(self) -> bool:
+        """
+        Loads the no-hitter dictionaries from the cache. Returns whether the load succeeded,
+        removes the cached file if it cannot be read.
+        """
+        try:
+            with self._cache_file.open("rb") as file:
+                cached_dicts = pickle.load(file)
+            loaded_dicts = {name: cached_dicts[name] for name in self._dict_names}
+        except (
+            OSError,
+            EOFError,  # includes a truncated file
+            pickle.UnpicklingError,
+            KeyError,  # includes a cache missing one of the dictionaries
+        ) as exc:
+            dev_alert(f"discarding no-hitter cache that could not be loaded: {exc!r}")
+            self._cache_file.unlink(missing_ok=True)
+            return False
+
+        for name, cached_dict in loaded_dicts.items():
+            setattr(self, name, cached_dict)
+        return True
+
+    def _save(self) -> None:
+        """Saves the no-hitter dictionaries to the cache, removes the legacy cache file."""
+        cached_dicts = {name: getattr(self, name) for name in self._dict_names}
+        # write to a temporary file first so that an interrupted save can't corrupt the cache
+        fd, temp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                pickle.dump(cached_dicts, file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, self._cache_file)
+        except BaseException:
+            os.remove(temp_path)
+            raise
+        self._legacy_cache_file.unlink(missing_ok=True)
 
     def _get(self) -> pd.DataFrame:
-        """Gets no-hitter data from Baseball Reference, saves it to the cache."""
+        """Gets no-hitter data from Baseball Reference."""
         write("gathering no-hitters")
         page = req_mgr.get_page("/friv/no-hitters-and-perfect-games.shtml")
-        data_df = self._gather_data_df(page)
-        data_df.to_csv(self._cache_file, index=False)
-        return data_df
+        return self._gather_data_df(page)
 
     def _gather_data_df(self, page: Response) -> pd.DataFrame:
         """Scrapes no-hitters page and generate `self.data_df`."""
@@ -142,7 +188,7 @@ class NoHitterDicts(Singleton):
         )
 
         # create player ID, game ID columns
-        player_id_column, game_id_column = [[] for _ in range(2)]
+        player_id_column, game_id_column = [], []
         for row in individual_table.find_all("a", href=True):
             href = row.get("href", "")
             if href.startswith("/players"):
@@ -197,7 +243,7 @@ class NoHitterDicts(Singleton):
         combined_df[["Year", "Team"]] = combined_df[["Year", "Team"]].ffill()
 
         # create player ID, game ID columns
-        player_id_column, game_id_column = [[] for _ in range(2)]
+        player_id_column, game_id_column = [], []
         for row in combined_table.find_all("a", href=True):
             href = row.get("href", "")
             if href.startswith("/players"):
@@ -40,39 +40,63 @@ def is_type(value: Any, expected_type: type | UnionType) -> bool:
     """
     Checks whether `value` is an instance of `expected_type`, including parameterized generics.
     """
+    return _type_checker(expected_type)(value)
+
+
+@functools.lru_cache(maxsize=None)
+def _type_checker(expected_type: type | UnionType) -> Callable[[Any], bool]:
+    """
+    Returns a function which checks whether a value is an instance of `expected_type`. Checkers
+    are cached, so each type hint is only broken down once.
+    """
     if expected_type == Any:
-        return True
+        return lambda value: True
 
-    origin = typing.get_origin(expected_type)
+    origin, args = typing.get_origin(expected_type), typing.get_args(expected_type)
     if origin is None:
-        return isinstance(value, expected_type)
+        return lambda value: isinstance(value, expected_type)
 
-    args = typing.get_args(expected_type)
     if origin is UnionType:
-        return any(is_type(value, arg) for arg in args)
-
-    if not isinstance(value, origin):
-        return False
+        arg_checkers = tuple(_type_checker(arg) for arg in args)
+        return lambda value: any(check(value) for check in arg_checkers)
 
     if origin in (list, set):
-        value: list | set
         # args can only have length 1
-        return all(is_type(item, *args) for item in value)
+        item_type = args[0]
+        if item_type != Any and typing.get_origin(item_type) is None:
+            # plain item types, e.g., list[str], don't need a nested checker
+            return lambda value: isinstance(value, origin) and all(
+                isinstance(item, item_type) for item in value
+            )
+        item_checker = _type_checker(item_type)
+        return lambda value: isinstance(value, origin) and all(item_checker(item) for item in value)
 
     if origin is tuple:
-        value: tuple
         # variable-length homogeneous tuple, e.g., Tuple[int, ...]
         if len(args) == 2 and args[1] is Ellipsis:
-            return all(is_type(item, args[0]) for item in value)
+            item_checker = _type_checker(args[0])
+            return lambda value: isinstance(value, tuple) and all(
+                item_checker(item) for item in value
+            )
 
         # fixed-length potentially heterogeneous tuple, e.g., Tuple[str, int, float]
-        if len(value) != len(args):
-            return False
-        return all(is_type(item, typ) for item, typ in zip(value, args))
+        item_checkers = tuple(_type_checker(arg) for arg in args)
+        return lambda value: (
+            isinstance(value, tuple)
+            and len(value) == len(item_checkers)
+            and all(check(item) for check, item in zip(item_checkers, value))
+        )
 
     if origin is dict:
-        value: dict
-        key_type, value_type = args
-        return all(is_type(k, key_type) and is_type(v, value_type) for k, v in value.items())
+        key_checker, value_checker = (_type_checker(arg) for arg in args)
+        return lambda value: isinstance(value, dict) and all(
+            key_checker(k) and value_checker(v) for k, v in value.items()
+        )
+
+    def unsupported_checker(value: Any) -> bool:
+        """Raises a `TypeError` for values which pass the `isinstance` check."""
+        if not isinstance(value, origin):
+            return False
+        raise TypeError(f"cannot evaluate type hint {expected_type}")
 
-    raise TypeError(f"cannot evaluate type hint {expected_type}")
+    return unsupported_checker
@@ -1,6 +1,8 @@
 """Defines utility functions used throughout the codebase."""
 
+from collections.abc import Collection
 from datetime import datetime
+from functools import lru_cache
 
 import pandas as pd
 from bs4 import BeautifulSoup as bs
@@ -20,30 +22,48 @@ def str_between(string: str, start: str, end: str, anchor: str = "start") -> str
     If `anchor` is `"end"`, the substring between the final occurrence of `end`
     and the final prior occurrence of `start` will be returned.
     """
-    if start not in string:
+    start_index = string.find(start)
+    if start_index == -1:
         raise ValueError(f'start value "{start}" not in string')
-    if end not in string:
+    end_index = string.rfind(end)
+    if end_index == -1:
         raise ValueError(f'end value "{end}" not in string')
 
+    # slice by index rather than splitting, which copies the rest of the string
     if anchor == "start":
-        return string.split(start, maxsplit=1)[1].split(end, maxsplit=1)[0]
+        start_index += len(start)
+        end_index = string.find(end, start_index)
+        return string[start_index : end_index if end_index != -1 else len(string)]
     if anchor == "end":
-        return string.rsplit(end, maxsplit=1)[0].rsplit(start, maxsplit=1)[1]
+        start_index = string.rfind(start, 0, end_index)
+        if start_index == -1:
+            raise ValueError(f'start value "{start}" not before final end value "{end}"')
+        return string[start_index + len(start) : end_index]
     raise ValueError('anchor value must be "start" or "end"')
 
 
 def str_remove(string: str, *substrings: str) -> str:
     """Removes instances of `substrings` from `string`."""
+    if all(len(substring) == 1 for substring in substrings):
+        # single characters can all be removed in one pass
+        return string.translate(_removal_table(substrings))
     for substring in substrings:
         string = string.replace(substring, "")
     return string
 
 
+@lru_cache(maxsize=64)
+def _removal_table(chars: tuple[str, ...]) -> dict[int, None]:
+    """Returns a `str.translate` table which removes `chars`."""
+    return str.maketrans("", "", "".join(chars))
+
+
 def clean_spaces(string: str) -> str:
     """Removes consecutive, leading, and trailing spaces from `string`."""
-    return " ".join(string.split()).strip()
+    return " ".join(string.split())
 
 
+@lru_cache(maxsize=4096)
 def reformat_date(string_date: str) -> str:
     """
     Converts `string_date` from "Month DD, YYYY" to YYYY-MM-DD for formatting consistency.
@@ -70,10 +90,7 @@ def soup_from_comment(tag: Tag, only_if_table: bool) -> bs | Tag:
         if only_if_table and not "<col><col><col>" in comment_contents:
             return tag
         return bs(comment_contents, "lxml")
-    except (
-        IndexError,  # thrown when indexing split functions in str_between
-        ValueError,  # thrown explicitly by str_between
-    ):
+    except ValueError:  # thrown explicitly by str_between
         return tag
 
 
@@ -84,24 +101,57 @@ def scrape_player_ids(table: bs | Tag) -> list[str]:
         link = row.get("href", "")
         if "players" not in link:
             continue
-        # [11:21] includes the period in ".shtml" so rsplit works if ID is short or has a period
-        player_id = link[11:21]
-        player_id_column.append(player_id.rsplit(".", maxsplit=1)[0])
+        player_id_column.append(player_id_from_link(link))
     return player_id_column
 
 
-def convert_innings_notation(innings: str | float) -> float | None:
-    """Converts box score notation to the correct numerical value so that values sum correctly."""
-    innings = str(innings) if not isinstance(innings, str) else innings
-    innings = innings.replace(".1", ".333334").replace(".2", ".666667")
-    if innings == "":
-        return None
-    return float(innings)
+def scrape_rows_and_player_ids(table: bs | Tag) -> tuple[list[list[str]], list[str]]:
+    """
+    Returns the cell text of each row in `table` and the player IDs from anchor tags in those rows,
+    visiting each row's elements once rather than traversing `table` again for the anchor tags.
+    """
+    records, player_id_column = [], []
+    for row in table.find_all("tr"):
+        record = []
+        for ele in row.find_all(["th", "td", "a"]):
+            if ele.name != "a":
+                record.append(ele.text.strip())
+            elif "players" in (link := ele.get("href", "")):
+                player_id_column.append(player_id_from_link(link))
+        records.append(record)
+    return records, player_id_column
+
+
+def player_id_from_link(link: str) -> str:
+    """Returns the player ID from `link`, the href of an anchor tag pointing to a player page."""
+    # [11:21] includes the period in ".shtml" so rsplit works if ID is short or has a period
+    return link[11:21].rsplit(".", maxsplit=1)[0]
 
 
-def convert_numeric_cols(df: pd.DataFrame) -> pd.DataFrame:
-    """Converts the numeric columns of `df` to correct dtypes using `pd.to_numeric`."""
+def convert_innings_col(innings: pd.Series) -> pd.Series:
+    """
+    Converts a column of box score innings notation to the correct numerical values so that
+    values sum correctly.
+    """
+    innings = (
+        innings.astype("string")
+        .str.replace(".1", ".333334", regex=False)
+        .str.replace(".2", ".666667", regex=False)
+    )
+    return pd.to_numeric(innings.mask(innings == ""))
+
+
+def convert_numeric_cols(
+    df: pd.DataFrame,
+    numeric_cols: Collection[str] | None = None,
+) -> pd.DataFrame:
+    """
+    Converts the numeric columns of `df` to correct dtypes using `pd.to_numeric`.
+    If `numeric_cols` is given, only those columns are considered.
+    """
     for col in df.columns:
+        if numeric_cols is not None and col not in numeric_cols:
+            continue
         try:
             df[col] = pd.to_numeric(df[col], errors="raise")
         except (
@@ -30,7 +30,7 @@ from ._helpers.requests_manager import req_mgr
 from ._helpers.typechecking import runtime_typecheck
 from ._helpers.utils import (
     clean_spaces,
-    convert_innings_notation,
+    convert_innings_col,
     convert_numeric_cols,
     game_id_to_endpoint,
     reformat_date,
@@ -824,7 +824,7 @@ class Game:
 
             # replace potential infinite season ERA, which would make column non-numeric
             p_df.loc[p_df["ERA"] == "inf", "ERA"] = pd.NA
-            p_df["IP"] = p_df["IP"].apply(convert_innings_notation)
+            p_df["IP"] = convert_innings_col(p_df["IP"])
 
             p_df.loc[p_df["Player"] != "Team Totals", "Position"] = "RP"
             p_df.at[0, "Position"] = "SP"  # the first pitcher to appear for the team
@@ -31,7 +31,7 @@ from ._helpers.requests_manager import req_mgr
 from ._helpers.typechecking import runtime_typecheck
 from ._helpers.utils import (
     clean_spaces,
-    convert_innings_notation,
+    convert_innings_col,
     convert_numeric_cols,
     reformat_date,
     soup_from_comment,
@@ -770,7 +770,7 @@ class Player:
         p_df_1 = p_df_1.rename(columns={"WAR": "Pitching bWAR", "Lg": "League"})
 
         p_df_1 = Player._process_career_totals(p_df_1)
-        p_df_1["IP"] = p_df_1["IP"].apply(convert_innings_notation)
+        p_df_1["IP"] = convert_innings_col(p_df_1["IP"])
 
         # count the team/league summary rows, which won't be under the advanced table
         summary_rows = p_df_1.loc[
@@ -791,7 +791,7 @@ class Player:
         career_position_totals_mask = self.fielding["Season"].str.contains("(", regex=False)
         self.fielding.loc[career_position_totals_mask, "Season"] = "Career Totals"
         if "Inn" in self.fielding.columns:
-            self.fielding["Inn"] = self.fielding["Inn"].apply(convert_innings_notation)
+            self.fielding["Inn"] = convert_innings_col(self.fielding["Inn"])
 
     def _process_awards_columns(self) -> None:
         """Adds season-level stats that are found in `"Awards"` columns to `self.bling`."""
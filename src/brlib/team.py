@@ -2,19 +2,27 @@
 
 import re
 
+import numpy as np
 import pandas as pd
 from bs4 import BeautifulSoup as bs
 from bs4 import Tag
 from curl_cffi.requests import Response
 
 from ._helpers.constants import (
+    PARK_FACTORS_REGEX,
     PLAYER_ID_REGEX,
     PYTHAGOREAN_EXPONENT,
     TEAM_BATTING_DTYPES,
+    TEAM_BATTING_NUMERIC_COLS,
     TEAM_BLING_DTYPES,
+    TEAM_BLING_ELEMENTS,
+    TEAM_BLING_NUMERIC_COLS,
     TEAM_FIELDING_DTYPES,
+    TEAM_FIELDING_NUMERIC_COLS,
     TEAM_INFO_DTYPES,
+    TEAM_INFO_NUMERIC_COLS,
     TEAM_PITCHING_DTYPES,
+    TEAM_PITCHING_NUMERIC_COLS,
     TEAM_REPLACEMENTS,
     TEAM_URL_REGEX,
     VENUE_REPLACEMENTS,
@@ -25,9 +33,9 @@ from ._helpers.requests_manager import req_mgr
 from ._helpers.typechecking import runtime_typecheck
 from ._helpers.utils import (
     clean_spaces,
-    convert_innings_notation,
+    convert_innings_col,
     convert_numeric_cols,
-    scrape_player_ids,
+    scrape_rows_and_player_ids,
     soup_from_comment,
     str_between,
 )
@@ -152,9 +160,8 @@ class Team:
 
         self.name = ""
         self.id = str_between(page.url, "teams/", ".shtml").replace("/", "")
-        self.info, self.bling, self.batting, self.pitching, self.fielding = [
-            pd.DataFrame() for _ in range(5)
-        ]
+        # populated by self._scrape_team
+        self.info = self.bling = self.batting = self.pitching = self.fielding = None
         self.players = []
         self._url = page.url
 
@@ -212,51 +219,36 @@ class Team:
         ```
         """
         nhd.populate()
-        self.pitching.loc[:, ["NH", "PG", "CNH"]] = 0
 
         inh_list = nhd.team_inh_dict.get(self.id, [])
         pg_list = nhd.team_pg_dict.get(self.id, [])
         cnh_list = nhd.team_cnh_dict.get(self.id, [])
 
+        # tally on arrays and write each column once, rather than through a .loc write per event
+        player_ids = self.pitching["Player ID"].fillna("").to_numpy()
+        game_types = self.pitching["Game Type"].str[0].fillna("").to_numpy()
+        is_totals = (self.pitching["Player"] == "Team Totals").fillna(False).to_numpy()
+        counts = {col: np.zeros(len(self.pitching), dtype="int64") for col in ("NH", "PG", "CNH")}
+
         # add individual no-hitters
         for col, inh_list in (("NH", inh_list), ("PG", pg_list)):
             for player, game_type in inh_list:
-                self.pitching.loc[
-                    (
-                        # player totals
-                        (self.pitching["Player ID"] == player)
-                        & (self.pitching["Game Type"].str.startswith(game_type))
-                    )
-                    | (
-                        # team totals row
-                        (self.pitching["Player"] == "Team Totals")
-                        & (self.pitching["Game Type"].str.startswith(game_type))
-                    ),
-                    col,
-                ] += 1
+                # player totals and team totals row
+                counts[col] += ((player_ids == player) | is_totals) & (game_types == game_type)
 
         # add combined no-hitters
-        games_logged = []
+        games_logged = set()
         for player, game_type, game_id in cnh_list:
             # player totals
-            self.pitching.loc[
-                (
-                    (self.pitching["Player ID"] == player)
-                    & (self.pitching["Game Type"].str.startswith(game_type))
-                ),
-                "CNH",
-            ] += 1
+            counts["CNH"] += (player_ids == player) & (game_types == game_type)
             # team totals row (only increment total once per game)
             # works when game_id is None because no team without box scores had multiple CNHs
             if game_id not in games_logged or game_id is None:
-                self.pitching.loc[
-                    (
-                        (self.pitching["Player"] == "Team Totals")
-                        & (self.pitching["Game Type"].str.startswith(game_type))
-                    ),
-                    "CNH",
-                ] += 1
-                games_logged.append(game_id)
+                counts["CNH"] += is_totals & (game_types == game_type)
+                games_logged.add(game_id)
+
+        for col, col_counts in counts.items():
+            self.pitching.loc[:, col] = pd.array(col_counts, dtype="Int64")
 
     def update_team_names(self) -> None:
         """
@@ -365,9 +357,9 @@ class Team:
         ):
             self.info = self.info.reindex(columns=list(TEAM_INFO_DTYPES))
             self.bling = self.bling.reindex(columns=list(TEAM_BLING_DTYPES))
-            self.batting = self.batting.reindex(columns=list(TEAM_BATTING_DTYPES))
-            self.pitching = self.pitching.reindex(columns=list(TEAM_PITCHING_DTYPES))
-            self.fielding = self.fielding.reindex(columns=list(TEAM_FIELDING_DTYPES))
+            self.batting = pd.DataFrame(columns=list(TEAM_BATTING_DTYPES))
+            self.pitching = pd.DataFrame(columns=list(TEAM_PITCHING_DTYPES))
+            self.fielding = pd.DataFrame(columns=list(TEAM_FIELDING_DTYPES))
 
             self.info = self.info.astype(TEAM_INFO_DTYPES)
             self.bling = self.bling.astype(TEAM_BLING_DTYPES)
@@ -377,7 +369,7 @@ class Team:
             return
 
         # gather player stats from the relevant tables
-        h_df_1, h_df_2, p_df_1, p_df_2 = [pd.DataFrame() for _ in range(4)]
+        h_df_1, h_df_2, p_df_1, p_df_2, self.fielding = [pd.DataFrame() for _ in range(5)]
         page_tables = content.find_all("div", {"class": "table_wrapper"}, recursive=False)
         for table in page_tables:
             table_name = table.get("id")
@@ -398,7 +390,7 @@ class Team:
                 p_df_1 = self._scrape_standard_table(table)
 
                 p_df_1 = p_df_1.rename(columns={"WAR": "Pitching bWAR"})
-                p_df_1["IP"] = p_df_1["IP"].apply(convert_innings_notation)
+                p_df_1["IP"] = convert_innings_col(p_df_1["IP"])
 
             elif table_name == "all_players_value_pitching":
                 table = soup_from_comment(table, only_if_table=True)
@@ -409,7 +401,7 @@ class Team:
                 self.fielding = self._scrape_standard_table(table)
 
                 if "Inn" in self.fielding.columns:
-                    self.fielding["Inn"] = self.fielding["Inn"].apply(convert_innings_notation)
+                    self.fielding["Inn"] = convert_innings_col(self.fielding["Inn"])
 
         # merge sorted dfs on index
         self.batting = h_df_1.merge(h_df_2, how="left", left_index=True, right_index=True)
@@ -428,11 +420,17 @@ class Team:
         self.pitching = self.pitching.reindex(columns=list(TEAM_PITCHING_DTYPES))
         self.fielding = self.fielding.reindex(columns=list(TEAM_FIELDING_DTYPES))
 
-        self.info = convert_numeric_cols(self.info).astype(TEAM_INFO_DTYPES)
-        self.bling = convert_numeric_cols(self.bling).astype(TEAM_BLING_DTYPES)
-        self.batting = convert_numeric_cols(self.batting).astype(TEAM_BATTING_DTYPES)
-        self.pitching = convert_numeric_cols(self.pitching).astype(TEAM_PITCHING_DTYPES)
-        self.fielding = convert_numeric_cols(self.fielding).astype(TEAM_FIELDING_DTYPES)
+        self.info = convert_numeric_cols(self.info, TEAM_INFO_NUMERIC_COLS)
+        self.bling = convert_numeric_cols(self.bling, TEAM_BLING_NUMERIC_COLS)
+        self.batting = convert_numeric_cols(self.batting, TEAM_BATTING_NUMERIC_COLS)
+        self.pitching = convert_numeric_cols(self.pitching, TEAM_PITCHING_NUMERIC_COLS)
+        self.fielding = convert_numeric_cols(self.fielding, TEAM_FIELDING_NUMERIC_COLS)
+
+        self.info = self.info.astype(TEAM_INFO_DTYPES)
+        self.bling = self.bling.astype(TEAM_BLING_DTYPES)
+        self.batting = self.batting.astype(TEAM_BATTING_DTYPES)
+        self.pitching = self.pitching.astype(TEAM_PITCHING_DTYPES)
+        self.fielding = self.fielding.astype(TEAM_FIELDING_DTYPES)
 
         self.players = list(dict.fromkeys(self.players))
         if len(self.bling) != len(self.players) + 1:
@@ -513,28 +511,19 @@ class Team:
                 self.info["Attendance"] = int(attendance_str.replace(",", ""))
 
             elif line_str.startswith("Park Factors"):
-                # if park factors are last info item, this may be included in line_str
-                line_str = line_str.replace("More team info, park factors, postseason, & more", "")
-                multi_year = one_year = ""
-                if "Multi-year:" in line_str:
-                    if "One-year" in line_str:
-                        multi_year = str_between(line_str, "Multi-year:", "One-year:")
-                        one_year = line_str.split("One-year:", maxsplit=1)[1]
-                    else:
-                        multi_year = line_str.split("Multi-year:", maxsplit=1)[1]
-                else:
+                # e.g., "Multi-year: Batting - 100, Pitching - 98 One-year: Batting - 102, ..."
+                park_factors = {
+                    match["span"]: (match["batting"], match["pitching"])
+                    for match in PARK_FACTORS_REGEX.finditer(line_str)
+                }
+                # each span listed in the line should have been matched
+                listed_spans = {span for span in ("Multi", "One") if f"{span}-year:" in line_str}
+                if not park_factors or listed_spans != park_factors.keys():
+                    dev_alert(f'{self.id}: could not parse park factors "{line_str.strip()}"')
+                elif "Multi" not in park_factors:
                     dev_alert(f"{self.id}: only one-year park factors; potential test case")
-                    one_year = line_str.split("One-year:", maxsplit=1)[1]
-
-                my_bat = my_pit = oy_bat = oy_pit = pd.NA
-                if multi_year != "":
-                    my_bat, my_pit = multi_year.strip().split(", ", maxsplit=1)
-                    my_bat = my_bat.split(" - ", maxsplit=1)[1]
-                    my_pit = my_pit.split(" - ", maxsplit=1)[1]
-                if one_year != "":
-                    oy_bat, oy_pit = one_year.strip().split(", ", maxsplit=1)
-                    oy_bat = oy_bat.split(" - ", maxsplit=1)[1]
-                    oy_pit = oy_pit.split(" - ", maxsplit=1)[1]
+                my_bat, my_pit = park_factors.get("Multi", (pd.NA, pd.NA))
+                oy_bat, oy_pit = park_factors.get("One", (pd.NA, pd.NA))
                 self.info["Multi-Year Batting Park Factor"] = my_bat
                 self.info["Multi-Year Pitching Park Factor"] = my_pit
                 self.info["One-Year Batting Park Factor"] = oy_bat
@@ -552,41 +541,37 @@ class Team:
 
     def _scrape_bling(self, bling: Tag | None) -> None:
         """Populates `self.bling` with data from `bling`."""
-        self.bling[["Team Gold Glove", "Pennant", "World Series"]] = 0
-        if bling is None:
-            return
-        for line in bling.find_all("a"):
-            bling_name = line.text
-            if bling_name == "Team Gold Glove":
-                self.bling.loc[:, "Team Gold Glove"] = 1
-            elif bling_name == "World Series Champions":
-                self.bling.loc[:, "World Series"] = 1
-            elif bling_name[-7:] == "Pennant":
-                self.bling.loc[:, "Pennant"] = 1
-            else:
-                dev_alert(f'{self.id}: unexpected bling element "{bling_name}"')
+        team_bling = {"Team Gold Glove": 0, "Pennant": 0, "World Series": 0}
+        if bling is not None:
+            for line in bling.find_all("a"):
+                bling_name = line.text
+                if bling_name in TEAM_BLING_ELEMENTS:
+                    team_bling[TEAM_BLING_ELEMENTS[bling_name]] = 1
+                elif bling_name.endswith("Pennant"):
+                    team_bling["Pennant"] = 1
+                else:
+                    dev_alert(f'{self.id}: unexpected bling element "{bling_name}"')
+        self.bling = self.bling.assign(**team_bling)
 
     def _scrape_standard_table(self, table: bs) -> pd.DataFrame:
         """Gathers team standard batting/pitching/fielding stats from `table`."""
         # scrape regular season and postseason tabs
-        reg_records, post_records = [[] for _ in range(2)]
-        end_of_reg_table = found_postseason_table = False
-
-        for row in table.find_all("tr"):
-            record = [ele.text.strip() for ele in row.find_all(["th", "td"])]
+        records, player_id_column = scrape_rows_and_player_ids(table)
 
-            # figure out when the postseason table starts
+        # figure out when the postseason table starts
+        postseason_start = len(records)
+        end_of_reg_table = False
+        for i, record in enumerate(records):
             if "Totals" in record[1]:
                 # we're in the final rows of regular season table
                 end_of_reg_table = True
-            if end_of_reg_table and record[0] == "Rk":
+            elif end_of_reg_table and record[0] == "Rk":
                 # we're on another column label row and therefore a new table
-                found_postseason_table = True
-
-            if found_postseason_table:
-                post_records.append(record)
-            else:
-                reg_records.append(record)
+                postseason_start = i
+                break
+        reg_records = records[:postseason_start]
+        post_records = records[postseason_start:]
+        found_postseason_table = len(post_records) != 0
 
         # set up DataFrame
         # remove fielding upper category row (Standard, Total Zone, DRS, etc.) if it exists
@@ -608,10 +593,10 @@ class Team:
 
         # remove column label rows
         df_1 = df_1.loc[(df_1["Rk"] != "Rk") & (df_1["Player"] != "Standard")]
-        # remove IL/40-man status for active teams
-        df_1["Player"] = df_1["Player"].str.split(" (", regex=False, n=1, expand=True)[0]
-        # remove handedness indicators
-        df_1.loc[:, "Player"] = df_1["Player"].str.strip("*#")
+        # remove IL/40-man status for active teams, then handedness indicators
+        df_1["Player"] = (
+            df_1["Player"].str.split(" (", regex=False, n=1, expand=True)[0].str.strip("*#")
+        )
 
         # missing position values should not be an empty string
         if "Pos" in df_1.columns:
@@ -621,7 +606,6 @@ class Team:
             df_1.loc[df_1["Position"] == "", "Position"] = pd.NA
 
         # add player IDs to table, excluding non-player rows
-        player_id_column = scrape_player_ids(table)
         df_1.loc[df_1["Rk"] != "", "Player ID"] = player_id_column
         df_1.loc[df_1["Player ID"] == "nan", "Player ID"] = pd.NA
         self.players += player_id_column
@@ -719,10 +703,7 @@ class Team:
     def _scrape_value_table(self, table: bs) -> pd.DataFrame:
         """Gathers team value batting/pitching stats from `table`."""
         # scrape table
-        records = []
-        for row in table.find_all("tr"):
-            record = [ele.text.strip() for ele in row.find_all(["th", "td"])]
-            records.append(record)
+        records, player_id_column = scrape_rows_and_player_ids(table)
 
         # set up DataFrame
         column_names = records.pop(0)
@@ -733,7 +714,6 @@ class Team:
         df_2["Player"] = df_2["Player"].str.split(" (", regex=False, n=1, expand=True)[0]
 
         # add player IDs to table, excluding non-player rows
-        player_id_column = scrape_player_ids(table)
         df_2.loc[df_2["Rk"] != "", "Player ID"] = player_id_column
         df_2.loc[df_2["Player ID"] == "nan", "Player ID"] = pd.NA
         self.players += player_id_column
@@ -94,14 +94,13 @@ class TeamSet:
         if len(self._contents) == 0:
             raise ValueError("no Teams to aggregate")
 
-        self.info = pd.concat([t.info for t in teams], ignore_index=True)
-        self.bling = pd.concat([t.bling for t in teams], ignore_index=True)
-        self.batting = pd.concat([t.batting for t in teams], ignore_index=True)
-        self.pitching = pd.concat([t.pitching for t in teams], ignore_index=True)
-        self.fielding = pd.concat([t.fielding for t in teams], ignore_index=True)
+        self.info = _concat_frames([t.info for t in teams])
+        self.bling = _concat_frames([t.bling for t in teams])
+        self.batting = _concat_frames([t.batting for t in teams])
+        self.pitching = _concat_frames([t.pitching for t in teams])
+        self.fielding = _concat_frames([t.fielding for t in teams])
 
-        self.players = list(chain.from_iterable(t.players for t in teams))
-        self.players = list(dict.fromkeys(self.players))
+        self.players = list(dict.fromkeys(chain.from_iterable(t.players for t in teams)))
 
         self._gather_records()
 
@@ -117,20 +116,27 @@ class TeamSet:
 
     def _gather_records(self) -> None:
         """Populates `self.records`."""
-        prep_df = self.info.copy()
         # All-Star teams have no team ID, so they are excluded
-        non_asg_rows = ~prep_df["Team ID"].isna()
-        prep_df.loc[non_asg_rows, "Franchise"] = prep_df.loc[non_asg_rows, "Team ID"].apply(
-            lambda x: abv_mgr.franchise_abv(x[:-4], int(x[-4:]))
+        non_asg_rows = ~self.info["Team ID"].isna()
+        # look up each distinct team ID once
+        team_ids = self.info.loc[non_asg_rows, "Team ID"]
+        franchises = {
+            team_id: abv_mgr.franchise_abv(team_id[:-4], int(team_id[-4:]))
+            for team_id in team_ids.unique()
+        }
+        franchise = self.info["Team"].to_numpy(dtype=object, copy=True)
+        franchise[non_asg_rows.to_numpy()] = team_ids.map(franchises).to_numpy()
+        self.records = (
+            self.info[["Wins", "Losses", "Ties"]]
+            .groupby(franchise)
+            .sum()
+            .rename_axis("Franchise")
+            .reset_index()
         )
-        prep_df.loc[~non_asg_rows, "Franchise"] = prep_df.loc[~non_asg_rows, "Team"]
-        self.records = prep_df.groupby("Franchise")[["Wins", "Losses", "Ties"]].sum()
 
-        self.records = self.records.reset_index()
-        self.records["Games"] = self.records[["Wins", "Losses", "Ties"]].sum(axis=1).astype("Int64")
-        self.records["W-L%"] = self.records["Wins"] / (
-            self.records["Wins"] + self.records["Losses"]
-        )
+        wins, losses, ties = (self.records[col] for col in ("Wins", "Losses", "Ties"))
+        self.records["Games"] = (wins + losses + ties).astype("Int64")
+        self.records["W-L%"] = wins / (wins + losses)
         self.records = self.records.reindex(columns=list(RECORDS_DTYPES))
         self.records = self.records.astype(RECORDS_DTYPES)
 
@@ -192,62 +198,55 @@ class TeamSet:
         nhd.populate()
         self.pitching.loc[:, ["NH", "PG", "CNH"]] = 0
 
-        # find the team with no-hitters
-        nh_teams = set()
-        nh_teams.update(nhd.team_inh_dict.keys())
-        nh_teams.update(nhd.team_pg_dict.keys())
-        nh_teams.update(nhd.team_cnh_dict.keys())
-        nh_teams = set(self._contents).intersection(nh_teams)
-
-        for team_id in list(nh_teams):
-            individual_nh_list = nhd.team_inh_dict.get(team_id, [])
-            perfect_game_list = nhd.team_pg_dict.get(team_id, [])
-            combined_nh_list = nhd.team_cnh_dict.get(team_id, [])
-            team_mask = self.pitching["Team ID"] == team_id
-
-            # add individual no-hitters
-            for col, inh_list in (("NH", individual_nh_list), ("PG", perfect_game_list)):
-                for player, game_type in inh_list:
-                    self.pitching.loc[
-                        team_mask
-                        & (
-                            (
-                                # player totals
-                                (self.pitching["Player ID"] == player)
-                                & (self.pitching["Game Type"].str.startswith(game_type))
-                            )
-                            | (
-                                # team totals row
-                                (self.pitching["Player"] == "Team Totals")
-                                & (self.pitching["Game Type"].str.startswith(game_type))
-                            )
-                        ),
-                        col,
-                    ] += 1
-
-            # add combined no-hitters
-            games_logged = []
-            for player, game_type, game_id in combined_nh_list:
-                # player totals
-                self.pitching.loc[
-                    (self.pitching["Team ID"] == team_id)
-                    & (
-                        (self.pitching["Player ID"] == player)
-                        & (self.pitching["Game Type"].str.startswith(game_type))
-                    ),
-                    "CNH",
-                ] += 1
-                # team totals row (only increment total once per game)
-                if game_id not in games_logged:
-                    self.pitching.loc[
-                        (self.pitching["Team ID"] == team_id)
-                        & (
-                            (self.pitching["Player"] == "Team Totals")
-                            & (self.pitching["Game Type"].str.startswith(game_type))
-                        ),
-                        "CNH",
-                    ] += 1
-                    games_logged.append(game_id)
+        # gather (team, player, game type, column) increments, with None as the player of the
+        # team totals rows
+        increments = []
+        for team_id in dict.fromkeys(self._contents):
+            for col, inh_dict in (("NH", nhd.team_inh_dict), ("PG", nhd.team_pg_dict)):
+                for player, game_type in inh_dict.get(team_id, []):
+                    increments.append((team_id, player, game_type, col))
+                    increments.append((team_id, None, game_type, col))
+
+            cnh_list = nhd.team_cnh_dict.get(team_id, [])
+            increments.extend(
+                (team_id, player, game_type, "CNH") for player, game_type, _ in cnh_list
+            )
+            # team totals are only incremented once per combined no-hitter
+            cnh_games = {}
+            for _, game_type, game_id in cnh_list:
+                cnh_games.setdefault(game_id, game_type)
+            increments.extend((team_id, None, game_type, "CNH") for game_type in cnh_games.values())
+        if len(increments) == 0:
+            return
+
+        keys = ["Team ID", "Player ID", "Game Type"]
+        increments_df = (
+            pd.DataFrame(increments, columns=keys + ["Column"])
+            .fillna({"Player ID": "Team Totals"})
+            .groupby(keys)["Column"]
+            .value_counts()
+            .unstack(fill_value=0)
+        )
+        # only the rows of teams with no-hitters need keys, which match team totals rows by
+        # player and each row's game type by its first letter
+        nh_rows = self.pitching["Team ID"].isin(increments_df.index.unique("Team ID")).to_numpy()
+        nh_pitching = self.pitching.loc[nh_rows]
+        pitching_keys = pd.DataFrame(
+            {
+                "Team ID": nh_pitching["Team ID"],
+                "Player ID": nh_pitching["Player ID"].mask(
+                    nh_pitching["Player"] == "Team Totals", "Team Totals"
+                ),
+                "Game Type": nh_pitching["Game Type"].str[0],
+            }
+        ).fillna("")
+        counts = (
+            pitching_keys.merge(increments_df, how="left", left_on=keys, right_index=True)
+            .reindex(columns=["NH", "PG", "CNH"])
+            .fillna(0)
+            .astype("int64")
+        )
+        self.pitching.loc[nh_rows, ["NH", "PG", "CNH"]] = counts.to_numpy()
 
     def update_team_names(self) -> None:
         """
@@ -278,8 +277,14 @@ class TeamSet:
         Name: Team, dtype: string
         ```
         """
-        self.info["Team"] = (
-            self.info["Team ID"].map(TEAM_REPLACEMENTS).fillna(self.info["Team"]).astype("string")
+        # info has one row per team, so direct lookups are cheaper than mapping the whole dict
+        self.info["Team"] = pd.Series(
+            [
+                TEAM_REPLACEMENTS.get(team_id, team)
+                for team_id, team in zip(self.info["Team ID"], self.info["Team"])
+            ],
+            index=self.info.index,
+            dtype="string",
         )
 
     def update_venue_names(self) -> None:
@@ -322,3 +327,11 @@ class TeamSet:
             )
             .astype("string")
         )
+
+
+def _concat_frames(dfs: list[pd.DataFrame]) -> pd.DataFrame:
+    """Concatenates `dfs` with a new index, skipping `pd.concat` when there is only one."""
+    if len(dfs) == 1:
+        # copy-on-write keeps the Team's DataFrame unaffected if the result is modified
+        return dfs[0].reset_index(drop=True)
+    return pd.concat(dfs, ignore_index=True)
@@ -1,43 +1,65 @@
 """Tests the attributes of the `NoHitterDicts` singleton."""
 
-import copy
-
 import pandas as pd
+import pytest
 
 from brlib._helpers.no_hitter_dicts import nhd
 
-
-def test_cache() -> None:
-    """Tests that the contents are the same whether loaded from cache or the web."""
-    # load data from the web
+# expected values too long to write inline, built once at import
+SEA201206080_CNH = [
+    "millwke01",
+    "furbuch01",
+    "pryorst01",
+    "leagubr01",
+    "luetglu01",
+    "wilheto01",
+]
+LAD2018_CNH = [
+    ["buehlwa01", "R", "SDN201805040"],
+    ["cingrto01", "R", "SDN201805040"],
+    ["garciyi01", "R", "SDN201805040"],
+    ["liberad01", "R", "SDN201805040"],
+]
+HOU2022_CNH = [
+    ["javiecr01", "P", "PHI202211020"],
+    ["abreubr01", "P", "PHI202211020"],
+    ["montera01", "P", "PHI202211020"],
+    ["pressry01", "P", "PHI202211020"],
+    ["javiecr01", "R", "NYA202206250"],
+    ["nerishe01", "R", "NYA202206250"],
+    ["pressry01", "R", "NYA202206250"],
+]
+
+
+@pytest.fixture(scope="module")
+def web_dicts() -> dict[str, dict]:
+    """Populates `nhd` from the web, returns its dictionaries."""
     nhd.populate()
-    assert nhd._has_valid_cache
+    return {name: getattr(nhd, name) for name in nhd._dict_names}
+
 
-    expected_gi = copy.deepcopy(nhd.game_inh_dict)
-    expected_gp = copy.deepcopy(nhd.game_pg_dict)
-    expected_gc = copy.deepcopy(nhd.game_cnh_dict)
-    expected_pi = copy.deepcopy(nhd.player_inh_dict)
-    expected_pp = copy.deepcopy(nhd.player_pg_dict)
-    expected_pc = copy.deepcopy(nhd.player_cnh_dict)
-    expected_ti = copy.deepcopy(nhd.team_inh_dict)
-    expected_tp = copy.deepcopy(nhd.team_pg_dict)
-    expected_tc = copy.deepcopy(nhd.team_cnh_dict)
-
-    # reset nhd and load data from cache
+@pytest.fixture(scope="module")
+def cached_dicts(web_dicts: dict[str, dict]) -> dict[str, dict]:
+    """Resets `nhd` and populates it from the cache, returns its dictionaries."""
+    # resetting rebinds the attributes, so web_dicts is left intact without copying
     nhd.__init__()
     nhd.populate()
+    return {name: getattr(nhd, name) for name in nhd._dict_names}
 
-    assert nhd.game_inh_dict == expected_gi
-    assert nhd.game_pg_dict == expected_gp
-    assert nhd.game_cnh_dict == expected_gc
-    assert nhd.player_inh_dict == expected_pi
-    assert nhd.player_pg_dict == expected_pp
-    assert nhd.player_cnh_dict == expected_pc
-    assert nhd.team_inh_dict == expected_ti
-    assert nhd.team_pg_dict == expected_tp
-    assert nhd.team_cnh_dict == expected_tc
+
+def test_cache_written(web_dicts: dict[str, dict]) -> None:
+    """Tests that populating `nhd` leaves a valid cache."""
+    assert all(web_dicts.values())
+    assert nhd._has_valid_cache
+
+
+@pytest.mark.parametrize("name", nhd._dict_names)
+def test_cache(name: str, web_dicts: dict[str, dict], cached_dicts: dict[str, dict]) -> None:
+    """Tests that the contents are the same whether loaded from cache or the web."""
+    assert cached_dicts[name] == web_dicts[name]
 
 
+@pytest.mark.usefixtures("web_dicts")
 def test_game_dicts() -> None:
     """Tests the contents of the game dictionaries."""
     assert nhd.game_inh_dict["CIN202408020"] == "snellbl01"
@@ -47,17 +69,11 @@ def test_game_dicts() -> None:
     assert nhd.game_pg_dict["NYA195610080"] == "larsedo01"  # postseason
 
     assert nhd.game_cnh_dict.get("NYA195610080") is None
-    assert nhd.game_cnh_dict["SEA201206080"] == [
-        "millwke01",
-        "furbuch01",
-        "pryorst01",
-        "leagubr01",
-        "luetglu01",
-        "wilheto01",
-    ]
+    assert nhd.game_cnh_dict["SEA201206080"] == SEA201206080_CNH
     assert nhd.game_cnh_dict["DET202307080"] == ["mannima02", "foleyja01", "langeal01"]
 
 
+@pytest.mark.usefixtures("web_dicts")
 def test_player_dicts() -> None:
     """Tests the contents of the player dictionaries."""
     assert nhd.player_inh_dict.get("pressry01") is None
@@ -76,6 +92,7 @@ def test_player_dicts() -> None:
     assert nhd.player_cnh_dict["pressry01"] == [["2022", "HOU", "P"], ["2022", "HOU", "R"]]
 
 
+@pytest.mark.usefixtures("web_dicts")
 def test_team_dicts() -> None:
     """Tests the contents of the team dictionaries."""
     assert nhd.team_inh_dict.get("LAD2018") is None
@@ -88,20 +105,7 @@ def test_team_dicts() -> None:
     assert nhd.team_pg_dict["NYY1956"] == [["larsedo01", "P"]]
 
     assert nhd.team_cnh_dict.get("SEA2018") is None
-    assert nhd.team_cnh_dict["LAD2018"] == [
-        ["buehlwa01", "R", "SDN201805040"],
-        ["cingrto01", "R", "SDN201805040"],
-        ["garciyi01", "R", "SDN201805040"],
-        ["liberad01", "R", "SDN201805040"],
-    ]
-    assert nhd.team_cnh_dict["HOU2022"] == [
-        ["javiecr01", "P", "PHI202211020"],
-        ["abreubr01", "P", "PHI202211020"],
-        ["montera01", "P", "PHI202211020"],
-        ["pressry01", "P", "PHI202211020"],
-        ["javiecr01", "R", "NYA202206250"],
-        ["nerishe01", "R", "NYA202206250"],
-        ["pressry01", "R", "NYA202206250"],
-    ]
+    assert nhd.team_cnh_dict["LAD2018"] == LAD2018_CNH
+    assert nhd.team_cnh_dict["HOU2022"] == HOU2022_CNH
     # check game ID value for combined no-hitters without a box score
     assert nhd.team_cnh_dict["KCM1923"] == [["roganbu99", "R", pd.NA], ["mendejo99", "R", pd.NA]]
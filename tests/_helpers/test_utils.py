@@ -1,8 +1,15 @@
 """Tests some of the functions in utils.py; the rest are covered by the end-to-end tests."""
 
+import pandas as pd
 import pytest
 
-from brlib._helpers.utils import clean_spaces, reformat_date, str_between, str_remove
+from brlib._helpers.utils import (
+    clean_spaces,
+    convert_innings_col,
+    reformat_date,
+    str_between,
+    str_remove,
+)
 
 
 def test_str_between() -> None:
@@ -18,12 +25,15 @@ def test_str_between() -> None:
         str_between("foo", "f", "/")
     with pytest.raises(ValueError):
         str_between("foo", "o", "f", anchor="last")
+    with pytest.raises(ValueError):
+        str_between("foo", "o", "f", anchor="end")
 
 
 def test_str_remove() -> None:
     """Tests the outputs of the `str_remove` function."""
     assert str_remove("f.o.o.b.a.z", ".") == "foobaz"
     assert str_remove("f.o/o,b`a'z", ".", "/", ",", "`", "'") == "foobaz"
+    assert str_remove("f<o>o<b>a<z>", "<o>", "<b>", "<z>") == "foa"
 
 
 def test_clean_spaces() -> None:
@@ -37,3 +47,11 @@ def test_reformat_date() -> None:
     assert reformat_date("October 02, 2022") == "2022-10-02"
     assert reformat_date("May 2, 2018") == "2018-05-02"
     assert reformat_date("2020") == ""
+
+
+def test_convert_innings_col() -> None:
+    """Tests the outputs of the `convert_innings_col` function."""
+    col = convert_innings_col(pd.Series(["5.1", "5.2", "", float("nan")]))
+    assert col.iloc[0] == pytest.approx(5.333334)
+    assert col.iloc[1] == pytest.approx(5.666667)
+    assert col.iloc[2:].isna().all()
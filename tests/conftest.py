@@ -1,16 +1,85 @@
 """Sets reusable objects for testing."""
 
 import copy
+import hashlib
+import os
+import pickle
 import warnings
+from collections.abc import Callable, Iterator
 from pathlib import Path
+from typing import TypeVar
 
 import pandas as pd
 import pytest
 from case_ids import game_test_cases, player_test_cases, team_test_cases
+from curl_cffi.requests import Response
+from get_expected import EXPECTED_DIR
 
 import brlib as br
 from brlib._helpers.abbreviations_manager import abv_mgr
 from brlib._helpers.constants import CACHE_DIR
+from brlib._helpers.requests_manager import req_mgr
+
+T = TypeVar("T")
+
+TESTS_DIR = Path(__file__).parent.resolve()
+# scraped fixtures are pickled here when BRLIB_TEST_CACHE=1, see _cached
+FIXTURE_CACHE_DIR = TESTS_DIR / ".fixture_cache"
+
+
+def _cached(name: str, key: object, func: Callable[[], T]) -> T:
+    """
+    Returns the output of `func`, which is pickled to and loaded from `FIXTURE_CACHE_DIR` if the
+    BRLIB_TEST_CACHE environment variable is set to 1. Set BRLIB_TEST_REFRESH=1 to overwrite the
+    cached output. Caching is opt-in, since cached outputs do not reflect changes to the scrapers.
+    """
+    if os.environ.get("BRLIB_TEST_CACHE") != "1":
+        return func()
+
+    digest = hashlib.sha1(repr(key).encode()).hexdigest()
+    cache_file = FIXTURE_CACHE_DIR / f"{name}-{digest}.pkl"
+    if cache_file.exists() and os.environ.get("BRLIB_TEST_REFRESH") != "1":
+        with cache_file.open("rb") as file:
+            return pickle.load(file)
+
+    output = func()
+    FIXTURE_CACHE_DIR.mkdir(exist_ok=True)
+    # write to a temporary file first so that concurrent runs never load a partial pickle
+    temp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+    with temp_file.open("wb") as file:
+        pickle.dump(output, file, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(temp_file, cache_file)
+    return output
+
+
+@pytest.fixture(scope="session", autouse=True)
+def cache_pages() -> Iterator[None]:
+    """
+    Caches the pages loaded during tests with `_cached`, so that repeat runs with
+    BRLIB_TEST_CACHE=1 make no requests, including those outside of the `*_list` fixtures.
+    """
+    if os.environ.get("BRLIB_TEST_CACHE") != "1":
+        yield
+        return
+
+    get_page = req_mgr.get_page
+
+    def cached_get_page(endpoint: str) -> Response:
+        """Returns the cached page at `endpoint`, loading it if it's not cached."""
+
+        def load() -> tuple[str, bytes]:
+            page = get_page(endpoint)
+            return page.url, page.content
+
+        # responses can't be pickled, so only the attributes brlib uses are cached
+        page = Response()
+        page.url, page.content = _cached("page", endpoint, load)
+        page.status_code = 200
+        return page
+
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(req_mgr, "get_page", cached_get_page)
+        yield
 
 
 @pytest.fixture(scope="session", autouse=True)
@@ -46,7 +115,7 @@ def test_clear_cache() -> None:
     abv_mgr.__init__()
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def ap_filtered() -> pd.DataFrame:
     """The output of `all_players`, filtered to a stable subset of retired players."""
     ap = br.all_players()
@@ -54,16 +123,27 @@ def ap_filtered() -> pd.DataFrame:
     return ap
 
 
+@pytest.fixture
+def version() -> str:
+    """
+    Which version of the outputs is being tested: "original" (before any public methods are run)
+    unless a test parametrizes `version` with "updated".
+    """
+    return "original"
+
+
 @pytest.fixture(scope="session")
 def expected_game_data() -> Path:
     """The directory containing the expected game data."""
-    return Path(__file__).parent.resolve() / "expected" / "games"
+    return EXPECTED_DIR / "games"
 
 
 @pytest.fixture(scope="session")
 def games_list() -> list[br.Game]:
     """The `Game` outputs to be tested before any public methods are run."""
-    return br.get_games(game_test_cases, ignore_errors=False)
+    return _cached(
+        "games", game_test_cases, lambda: br.get_games(game_test_cases, ignore_errors=False)
+    )
 
 
 @pytest.fixture(scope="session")
@@ -77,6 +157,17 @@ def updated_games_list(games_list: list[br.Game]) -> list[br.Game]:
     return games_list_copy
 
 
+@pytest.fixture(scope="session")
+def games_by_id(
+    games_list: list[br.Game], updated_games_list: list[br.Game]
+) -> dict[str, dict[str, br.Game]]:
+    """The `Game` outputs to be tested, keyed by version and then by ID."""
+    return {
+        "original": {game.id: game for game in games_list},
+        "updated": {game.id: game for game in updated_games_list},
+    }
+
+
 @pytest.fixture(scope="session")
 def game_set(games_list: list[br.Game]) -> br.GameSet:
     """A `GameSet` made from the contents of `games_list` before any public methods are run."""
@@ -96,13 +187,15 @@ def updated_game_set(game_set: br.GameSet) -> br.GameSet:
 @pytest.fixture(scope="session")
 def expected_player_data() -> Path:
     """The directory containing the expected player data."""
-    return Path(__file__).parent.resolve() / "expected" / "players"
+    return EXPECTED_DIR / "players"
 
 
 @pytest.fixture(scope="session")
 def players_list() -> list[br.Player]:
     """The `Player` outputs to be tested before any public methods are run."""
-    return br.get_players(player_test_cases, ignore_errors=False)
+    return _cached(
+        "players", player_test_cases, lambda: br.get_players(player_test_cases, ignore_errors=False)
+    )
 
 
 @pytest.fixture(scope="session")
@@ -114,6 +207,17 @@ def updated_players_list(players_list: list[br.Player]) -> list[br.Player]:
     return players_list_copy
 
 
+@pytest.fixture(scope="session")
+def players_by_id(
+    players_list: list[br.Player], updated_players_list: list[br.Player]
+) -> dict[str, dict[str, br.Player]]:
+    """The `Player` outputs to be tested, keyed by version and then by ID."""
+    return {
+        "original": {player.id: player for player in players_list},
+        "updated": {player.id: player for player in updated_players_list},
+    }
+
+
 @pytest.fixture(scope="session")
 def player_set(players_list: list[br.Player]) -> br.PlayerSet:
     """A `PlayerSet` made from the contents of `players_list` before any public methods are run."""
@@ -131,13 +235,15 @@ def updated_player_set(player_set: br.PlayerSet) -> br.PlayerSet:
 @pytest.fixture(scope="session")
 def expected_team_data() -> Path:
     """The directory containing the expected team data."""
-    return Path(__file__).parent.resolve() / "expected" / "teams"
+    return EXPECTED_DIR / "teams"
 
 
 @pytest.fixture(scope="session")
 def teams_list() -> list[br.Team]:
     """The `Team` outputs to be tested before any public methods are run."""
-    return br.get_teams(team_test_cases, ignore_errors=False)
+    return _cached(
+        "teams", team_test_cases, lambda: br.get_teams(team_test_cases, ignore_errors=False)
+    )
 
 
 @pytest.fixture(scope="session")
@@ -151,6 +257,17 @@ def updated_teams_list(teams_list: list[br.Team]) -> list[br.Team]:
     return teams_list_copy
 
 
+@pytest.fixture(scope="session")
+def teams_by_id(
+    teams_list: list[br.Team], updated_teams_list: list[br.Team]
+) -> dict[str, dict[str, br.Team]]:
+    """The `Team` outputs to be tested, keyed by version and then by ID."""
+    return {
+        "original": {team.id: team for team in teams_list},
+        "updated": {team.id: team for team in updated_teams_list},
+    }
+
+
 @pytest.fixture(scope="session")
 def team_set(teams_list: list[br.Team]) -> br.TeamSet:
     """A `TeamSet` made from the contents of `teams_list` before any public methods are run."""
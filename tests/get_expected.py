@@ -1,10 +1,92 @@
-"""Defines get_expected functions."""
+"""Defines get_expected functions and the expected dtypes of each DataFrame attribute."""
 
 import json
+from functools import lru_cache
 from pathlib import Path
 
 import pandas as pd
 
+from brlib._helpers.constants import (
+    GAME_BATTING_DTYPES,
+    GAME_FIELDING_DTYPES,
+    GAME_INFO_DTYPES,
+    GAME_PITCHING_DTYPES,
+    GAME_TEAM_INFO_DTYPES,
+    GAME_UMP_INFO_DTYPES,
+    PLAYER_BATTING_DTYPES,
+    PLAYER_BLING_DTYPES,
+    PLAYER_FIELDING_DTYPES,
+    PLAYER_INFO_DTYPES,
+    PLAYER_PITCHING_DTYPES,
+    PLAYER_SALARIES_DTYPES,
+    TEAM_BATTING_DTYPES,
+    TEAM_BLING_DTYPES,
+    TEAM_FIELDING_DTYPES,
+    TEAM_INFO_DTYPES,
+    TEAM_PITCHING_DTYPES,
+)
+
+EXPECTED_DIR = Path(__file__).parent.resolve() / "expected"
+
+# expected dtypes of each DataFrame attribute shared by the objects and their Sets
+GAME_TABLE_DTYPES = {
+    "info": GAME_INFO_DTYPES,
+    "batting": GAME_BATTING_DTYPES,
+    "pitching": GAME_PITCHING_DTYPES,
+    "fielding": GAME_FIELDING_DTYPES,
+    "team_info": GAME_TEAM_INFO_DTYPES,
+    "ump_info": GAME_UMP_INFO_DTYPES,
+}
+PLAYER_TABLE_DTYPES = {
+    "info": PLAYER_INFO_DTYPES,
+    "bling": PLAYER_BLING_DTYPES,
+    "batting": PLAYER_BATTING_DTYPES,
+    "pitching": PLAYER_PITCHING_DTYPES,
+    "fielding": PLAYER_FIELDING_DTYPES,
+    "salaries": PLAYER_SALARIES_DTYPES,
+}
+TEAM_TABLE_DTYPES = {
+    "info": TEAM_INFO_DTYPES,
+    "bling": TEAM_BLING_DTYPES,
+    "batting": TEAM_BATTING_DTYPES,
+    "pitching": TEAM_PITCHING_DTYPES,
+    "fielding": TEAM_FIELDING_DTYPES,
+}
+# DataFrame attributes which are changed by the public methods
+GAME_UPDATED_TABLES = ("info", "pitching", "team_info")
+PLAYER_UPDATED_TABLES = ("info", "pitching")
+TEAM_UPDATED_TABLES = ("info", "pitching")
+
+
+def table_cases(
+    table_dtypes: dict[str, dict[str, str] | None], updated_tables: tuple[str, ...]
+) -> list[tuple[str, str]]:
+    """
+    Returns the `(version, table)` pairs that `test_tables` functions are parametrized with: every
+    table in `table_dtypes` for the original outputs, and each of `updated_tables` for the updated
+    outputs.
+    """
+    return [("original", table) for table in table_dtypes] + [
+        ("updated", table) for table in updated_tables
+    ]
+
+
+def read_expected_csv(file: Path, dtypes_dict: dict[str, str] | None = None) -> pd.DataFrame:
+    """
+    Returns the contents of `file`, which is only parsed once per session. If `dtypes_dict` is
+    `None`, nullable dtypes are inferred. The returned DataFrame is shared, so don't modify it.
+    """
+    dtypes = None if dtypes_dict is None else tuple(dtypes_dict.items())
+    return _read_csv(file, dtypes)
+
+
+def read_expected_json(file: Path) -> list | dict:
+    """
+    Returns the contents of `file`, which is only parsed once per session. The returned object is
+    shared, so don't modify it.
+    """
+    return _read_json(file)
+
 
 def get_expected_df(
     category_dir: str,
@@ -17,13 +99,13 @@ def get_expected_df(
     contents of `category_dir`. If `updated` is `True`, the returned value is for the updated Set.
     """
     updated_original = "updated" if updated else "original"
-    cases_dir = Path(__file__).parent / "expected" / category_dir / updated_original
+    cases_dir = EXPECTED_DIR / category_dir / updated_original
     case_dirs = sorted(cases_dir.iterdir())
 
     tables = []
     for case_dir in case_dirs:
         data_file = case_dir / f"{target_table}.csv"
-        df = pd.read_csv(data_file, dtype=dtypes_dict)
+        df = read_expected_csv(data_file, dtypes_dict)
         if not df.empty:
             tables.append(df)
 
@@ -36,13 +118,27 @@ def get_expected_list(category_dir: str, target_list: str) -> list[str] | list[t
     Returns the expected value of a Set's `target_list` attribute by combining the relevant
     contents of `category_dir`.
     """
-    cases_dir = Path(__file__).parent / "expected" / category_dir / "original"
+    cases_dir = EXPECTED_DIR / category_dir / "original"
     case_dirs = sorted(cases_dir.iterdir())
 
     expected_list = []
     for case_dir in case_dirs:
         data_file = case_dir / f"{target_list}.json"
-        expected_list.extend(json.loads(data_file.read_bytes()))
+        expected_list.extend(read_expected_json(data_file))
 
     expected_list = list(dict.fromkeys(expected_list))
     return expected_list
+
+
+@lru_cache(maxsize=None)
+def _read_csv(file: Path, dtypes: tuple[tuple[str, str], ...] | None) -> pd.DataFrame:
+    """Parses `file` with `dtypes`, which is a hashable form of a dtypes dict."""
+    if dtypes is None:
+        return pd.read_csv(file, dtype_backend="numpy_nullable")
+    return pd.read_csv(file, dtype=dict(dtypes))
+
+
+@lru_cache(maxsize=None)
+def _read_json(file: Path) -> list | dict:
+    """Parses `file`."""
+    return json.loads(file.read_bytes())
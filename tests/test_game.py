@@ -1,136 +1,65 @@
 """Tests the attributes and methods of the `Game` class."""
 
-import json
 from pathlib import Path
 
 import pandas as pd
+import pytest
+from case_ids import game_test_cases
+from get_expected import (
+    GAME_TABLE_DTYPES,
+    GAME_UPDATED_TABLES,
+    read_expected_csv,
+    read_expected_json,
+    table_cases,
+)
 
 import brlib as br
-from brlib._helpers.constants import (
-    GAME_BATTING_DTYPES,
-    GAME_FIELDING_DTYPES,
-    GAME_INFO_DTYPES,
-    GAME_PITCHING_DTYPES,
-    GAME_TEAM_INFO_DTYPES,
-    GAME_UMP_INFO_DTYPES,
-)
+
+# runs a test against the outputs from both before and after the public methods are run
+both_versions = pytest.mark.parametrize("version", ["original", "updated"])
+# linescore is only an attribute of `Game`, and its dtypes can be inferred
+TABLE_DTYPES = GAME_TABLE_DTYPES | {"linescore": None}
+UPDATED_TABLES = GAME_UPDATED_TABLES + ("linescore",)
+
+
+@pytest.fixture(params=game_test_cases)
+def game(
+    request: pytest.FixtureRequest,
+    version: str,
+    games_by_id: dict[str, dict[str, br.Game]],
+) -> br.Game:
+    """The `Game` output being tested."""
+    return games_by_id[version][request.param]
+
+
+@pytest.fixture
+def expected_dir(expected_game_data: Path, version: str, game: br.Game) -> Path:
+    """The directory containing the expected outputs for `game`."""
+    return expected_game_data / version / game.id
+
+
+@pytest.mark.parametrize(("version", "table"), table_cases(TABLE_DTYPES, UPDATED_TABLES))
+def test_tables(expected_dir: Path, table: str, game: br.Game) -> None:
+    """Tests the contents of the DataFrame attributes."""
+    expected_df = read_expected_csv(expected_dir / f"{table}.csv", TABLE_DTYPES[table])
+    if table == "linescore":
+        expected_df = expected_df.astype({"Team": "string"})
+    pd.testing.assert_frame_equal(getattr(game, table), expected_df)
+
+
+@both_versions
+def test_name(game: br.Game) -> None:
+    """Tests that the `name` attribute matches the `info` DataFrame."""
+    assert game.info["Game"].iloc[0] == game.name
 
 
-def test_info(
-    expected_game_data: Path,
-    games_list: list[br.Game],
-    updated_games_list: list[br.Game],
-) -> None:
-    """Tests the contents of the `info` DataFrame."""
-    for game in games_list:
-        file = expected_game_data / "original" / game.id / "info.csv"
-        expected_df = pd.read_csv(file, dtype=GAME_INFO_DTYPES)
-        pd.testing.assert_frame_equal(game.info, expected_df)
-        assert game.info["Game"].iloc[0] == game.name
-
-    for game in updated_games_list:
-        file = expected_game_data / "updated" / game.id / "info.csv"
-        expected_df = pd.read_csv(file, dtype=GAME_INFO_DTYPES)
-        pd.testing.assert_frame_equal(game.info, expected_df)
-        assert game.info["Game"].iloc[0] == game.name
-
-
-def test_batting(
-    expected_game_data: Path,
-    games_list: list[br.Game],
-    updated_games_list: list[br.Game],
-) -> None:
-    """Tests the contents of the `batting` DataFrame."""
-    for game in games_list:
-        file = expected_game_data / "original" / game.id / "batting.csv"
-        expected_df = pd.read_csv(file, dtype=GAME_BATTING_DTYPES)
-        pd.testing.assert_frame_equal(game.batting, expected_df)
-
-
-def test_pitching(
-    expected_game_data: Path,
-    games_list: list[br.Game],
-    updated_games_list: list[br.Game],
-) -> None:
-    """Tests the contents of the `pitching` DataFrame."""
-    for game in games_list:
-        file = expected_game_data / "original" / game.id / "pitching.csv"
-        expected_df = pd.read_csv(file, dtype=GAME_PITCHING_DTYPES)
-        pd.testing.assert_frame_equal(game.pitching, expected_df)
-
-    for game in updated_games_list:
-        file = expected_game_data / "updated" / game.id / "pitching.csv"
-        expected_df = pd.read_csv(file, dtype=GAME_PITCHING_DTYPES)
-        pd.testing.assert_frame_equal(game.pitching, expected_df)
-
-
-def test_fielding(
-    expected_game_data: Path,
-    games_list: list[br.Game],
-    updated_games_list: list[br.Game],
-) -> None:
-    """Tests the contents of the `fielding` DataFrame."""
-    for game in games_list:
-        file = expected_game_data / "original" / game.id / "fielding.csv"
-        expected_df = pd.read_csv(file, dtype=GAME_FIELDING_DTYPES)
-        pd.testing.assert_frame_equal(game.fielding, expected_df)
-
-
-def test_linescore(
-    expected_game_data: Path,
-    games_list: list[br.Game],
-    updated_games_list: list[br.Game],
-) -> None:
-    """Tests the contents of the `linescore` DataFrame."""
-    for game in games_list:
-        file = expected_game_data / "original" / game.id / "linescore.csv"
-        expected_df = pd.read_csv(file, dtype_backend="numpy_nullable")
-        expected_df["Team"] = expected_df["Team"].astype("string")
-        pd.testing.assert_frame_equal(game.linescore, expected_df)
-
-    for game in updated_games_list:
-        file = expected_game_data / "updated" / game.id / "linescore.csv"
-        expected_df = pd.read_csv(file, dtype_backend="numpy_nullable")
-        expected_df["Team"] = expected_df["Team"].astype("string")
-        pd.testing.assert_frame_equal(game.linescore, expected_df)
-
-
-def test_team_info(
-    expected_game_data: Path,
-    games_list: list[br.Game],
-    updated_games_list: list[br.Game],
-) -> None:
-    """Tests the contents of the `team_info` DataFrame."""
-    for game in games_list:
-        file = expected_game_data / "original" / game.id / "team_info.csv"
-        expected_df = pd.read_csv(file, dtype=GAME_TEAM_INFO_DTYPES)
-        pd.testing.assert_frame_equal(game.team_info, expected_df)
-
-    for game in updated_games_list:
-        file = expected_game_data / "updated" / game.id / "team_info.csv"
-        expected_df = pd.read_csv(file, dtype=GAME_TEAM_INFO_DTYPES)
-        pd.testing.assert_frame_equal(game.team_info, expected_df)
-
-
-def test_ump_info(expected_game_data: Path, games_list: list[br.Game]) -> None:
-    """Tests the contents of the `ump_info` DataFrame."""
-    for game in games_list:
-        file = expected_game_data / "original" / game.id / "ump_info.csv"
-        expected_df = pd.read_csv(file, dtype=GAME_UMP_INFO_DTYPES)
-        pd.testing.assert_frame_equal(game.ump_info, expected_df)
-
-
-def test_players(expected_game_data: Path, games_list: list[br.Game]) -> None:
+def test_players(expected_dir: Path, game: br.Game) -> None:
     """Tests the contents of the `players` list."""
-    for game in games_list:
-        file = expected_game_data / "original" / game.id / "players.json"
-        expected_list = json.loads(file.read_bytes())
-        assert game.players == expected_list
+    expected_list = read_expected_json(expected_dir / "players.json")
+    assert game.players == expected_list
 
 
-def test_teams(expected_game_data: Path, games_list: list[br.Game]) -> None:
+def test_teams(expected_dir: Path, game: br.Game) -> None:
     """Tests the contents of the `teams` list."""
-    for game in games_list:
-        file = expected_game_data / "original" / game.id / "teams.json"
-        expected_list = json.loads(file.read_bytes())
-        assert game.teams == expected_list
+    expected_list = read_expected_json(expected_dir / "teams.json")
+    assert game.teams == expected_list
@@ -4,18 +4,17 @@ from pathlib import Path
 
 import pandas as pd
 import pytest
-from get_expected import get_expected_df, get_expected_list
+from get_expected import (
+    GAME_TABLE_DTYPES,
+    GAME_UPDATED_TABLES,
+    get_expected_df,
+    get_expected_list,
+    read_expected_csv,
+    table_cases,
+)
 
 import brlib as br
-from brlib._helpers.constants import (
-    GAME_BATTING_DTYPES,
-    GAME_FIELDING_DTYPES,
-    GAME_INFO_DTYPES,
-    GAME_PITCHING_DTYPES,
-    GAME_TEAM_INFO_DTYPES,
-    GAME_UMP_INFO_DTYPES,
-    RECORDS_DTYPES,
-)
+from brlib._helpers.constants import RECORDS_DTYPES
 
 
 def test_empty_rejection() -> None:
@@ -32,55 +31,20 @@ def test_dunders(games_list: list[br.Game], game_set: br.GameSet) -> None:
     assert repr(game_set) == f'GameSet({", ".join(game_reprs)})'  # single quotes for <3.12 support
 
 
-def test_info(game_set: br.GameSet, updated_game_set: br.GameSet) -> None:
-    """Tests the contents of the `info` DataFrame."""
-    expected_df = get_expected_df("games", "info", False, GAME_INFO_DTYPES)
-    pd.testing.assert_frame_equal(game_set.info, expected_df)
-
-    expected_df = get_expected_df("games", "info", True, GAME_INFO_DTYPES)
-    pd.testing.assert_frame_equal(updated_game_set.info, expected_df)
-
-
-def test_batting(game_set: br.GameSet, updated_game_set: br.GameSet) -> None:
-    """Tests the contents of the `batting` DataFrame."""
-    expected_df = get_expected_df("games", "batting", False, GAME_BATTING_DTYPES)
-    pd.testing.assert_frame_equal(game_set.batting, expected_df)
-
-
-def test_pitching(game_set: br.GameSet, updated_game_set: br.GameSet) -> None:
-    """Tests the contents of the `pitching` DataFrame."""
-    expected_df = get_expected_df("games", "pitching", False, GAME_PITCHING_DTYPES)
-    pd.testing.assert_frame_equal(game_set.pitching, expected_df)
-
-    expected_df = get_expected_df("games", "pitching", True, GAME_PITCHING_DTYPES)
-    pd.testing.assert_frame_equal(updated_game_set.pitching, expected_df)
-
-
-def test_fielding(game_set: br.GameSet, updated_game_set: br.GameSet) -> None:
-    """Tests the contents of the `fielding` DataFrame."""
-    expected_df = get_expected_df("games", "fielding", False, GAME_FIELDING_DTYPES)
-    pd.testing.assert_frame_equal(game_set.fielding, expected_df)
-
-
-def test_team_info(game_set: br.GameSet, updated_game_set: br.GameSet) -> None:
-    """Tests the contents of the `team_info` DataFrame."""
-    expected_df = get_expected_df("games", "team_info", False, GAME_TEAM_INFO_DTYPES)
-    pd.testing.assert_frame_equal(game_set.team_info, expected_df)
-
-    expected_df = get_expected_df("games", "team_info", True, GAME_TEAM_INFO_DTYPES)
-    pd.testing.assert_frame_equal(updated_game_set.team_info, expected_df)
-
-
-def test_ump_info(game_set: br.GameSet) -> None:
-    """Tests the contents of the `ump_info` DataFrame."""
-    expected_df = get_expected_df("games", "ump_info", False, GAME_UMP_INFO_DTYPES)
-    pd.testing.assert_frame_equal(game_set.ump_info, expected_df)
+@pytest.mark.parametrize(("version", "table"), table_cases(GAME_TABLE_DTYPES, GAME_UPDATED_TABLES))
+def test_tables(
+    version: str, table: str, game_set: br.GameSet, updated_game_set: br.GameSet
+) -> None:
+    """Tests the contents of the DataFrame attributes."""
+    tested_set = updated_game_set if version == "updated" else game_set
+    expected_df = get_expected_df("games", table, version == "updated", GAME_TABLE_DTYPES[table])
+    pd.testing.assert_frame_equal(getattr(tested_set, table), expected_df)
 
 
 def test_records(expected_game_data: Path, game_set: br.GameSet) -> None:
     """Tests the contents of the `records` DataFrame."""
     file = expected_game_data / "records.csv"
-    expected_df = pd.read_csv(file, dtype=RECORDS_DTYPES)
+    expected_df = read_expected_csv(file, RECORDS_DTYPES)
     pd.testing.assert_frame_equal(game_set.records, expected_df)
 
 
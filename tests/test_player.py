@@ -1,102 +1,53 @@
 """Tests the attributes and methods of the `Player` class."""
 
-import json
 from pathlib import Path
 
 import pandas as pd
-
-import brlib as br
-from brlib._helpers.constants import (
-    PLAYER_BATTING_DTYPES,
-    PLAYER_BLING_DTYPES,
-    PLAYER_FIELDING_DTYPES,
-    PLAYER_INFO_DTYPES,
-    PLAYER_PITCHING_DTYPES,
-    PLAYER_SALARIES_DTYPES,
+import pytest
+from case_ids import player_test_cases
+from get_expected import (
+    PLAYER_TABLE_DTYPES,
+    PLAYER_UPDATED_TABLES,
+    read_expected_csv,
+    read_expected_json,
+    table_cases,
 )
 
+import brlib as br
 
-def test_info(
-    expected_player_data: Path,
-    players_list: list[br.Player],
-    updated_players_list: list[br.Player],
-) -> None:
-    """Tests the contents of the `info` DataFrame."""
-    for player in players_list:
-        file = expected_player_data / "original" / player.id / "info.csv"
-        expected_df = pd.read_csv(file, dtype=PLAYER_INFO_DTYPES)
-        pd.testing.assert_frame_equal(player.info, expected_df)
-
-    for player in updated_players_list:
-        file = expected_player_data / "updated" / player.id / "info.csv"
-        expected_df = pd.read_csv(file, dtype=PLAYER_INFO_DTYPES)
-        pd.testing.assert_frame_equal(player.info, expected_df)
-
-
-def test_bling(expected_player_data: Path, players_list: list[br.Player]) -> None:
-    """Tests the contents of the `bling` DataFrame."""
-    for player in players_list:
-        file = expected_player_data / "original" / player.id / "bling.csv"
-        expected_df = pd.read_csv(file, dtype=PLAYER_BLING_DTYPES)
-        pd.testing.assert_frame_equal(player.bling, expected_df)
-
-
-def test_batting(expected_player_data: Path, players_list: list[br.Player]) -> None:
-    """Tests the contents of the `batting` DataFrame."""
-    for player in players_list:
-        file = expected_player_data / "original" / player.id / "batting.csv"
-        expected_df = pd.read_csv(file, dtype=PLAYER_BATTING_DTYPES)
-        pd.testing.assert_frame_equal(player.batting, expected_df)
-
-
-def test_pitching(
-    expected_player_data: Path,
-    players_list: list[br.Player],
-    updated_players_list: list[br.Player],
-) -> None:
-    """Tests the contents of the `pitching` DataFrame."""
-    for player in players_list:
-        file = expected_player_data / "original" / player.id / "pitching.csv"
-        expected_df = pd.read_csv(file, dtype=PLAYER_PITCHING_DTYPES)
-        pd.testing.assert_frame_equal(player.pitching, expected_df)
 
-    for player in updated_players_list:
-        file = expected_player_data / "updated" / player.id / "pitching.csv"
-        expected_df = pd.read_csv(file, dtype=PLAYER_PITCHING_DTYPES)
-        pd.testing.assert_frame_equal(player.pitching, expected_df)
+@pytest.fixture(params=player_test_cases)
+def player(
+    request: pytest.FixtureRequest,
+    version: str,
+    players_by_id: dict[str, dict[str, br.Player]],
+) -> br.Player:
+    """The `Player` output being tested."""
+    return players_by_id[version][request.param]
 
 
-def test_fielding(expected_player_data: Path, players_list: list[br.Player]) -> None:
-    """Tests the contents of the `fielding` DataFrame."""
-    for player in players_list:
-        file = expected_player_data / "original" / player.id / "fielding.csv"
-        expected_df = pd.read_csv(file, dtype=PLAYER_FIELDING_DTYPES)
-        pd.testing.assert_frame_equal(player.fielding, expected_df)
+@pytest.fixture
+def expected_dir(expected_player_data: Path, version: str, player: br.Player) -> Path:
+    """The directory containing the expected outputs for `player`."""
+    return expected_player_data / version / player.id
 
 
-def test_salaries(
-    expected_player_data: Path,
-    players_list: list[br.Player],
-    updated_players_list: list[br.Player],
-) -> None:
-    """Tests the contents of the `salaries` DataFrame."""
-    for player in players_list:
-        file = expected_player_data / "original" / player.id / "salaries.csv"
-        expected_df = pd.read_csv(file, dtype=PLAYER_SALARIES_DTYPES)
-        pd.testing.assert_frame_equal(player.salaries, expected_df)
+@pytest.mark.parametrize(
+    ("version", "table"), table_cases(PLAYER_TABLE_DTYPES, PLAYER_UPDATED_TABLES)
+)
+def test_tables(expected_dir: Path, table: str, player: br.Player) -> None:
+    """Tests the contents of the DataFrame attributes."""
+    expected_df = read_expected_csv(expected_dir / f"{table}.csv", PLAYER_TABLE_DTYPES[table])
+    pd.testing.assert_frame_equal(getattr(player, table), expected_df)
 
 
-def test_relatives(expected_player_data: Path, players_list: list[br.Player]) -> None:
+def test_relatives(expected_dir: Path, player: br.Player) -> None:
     """Tests the contents of the `relatives` dictionary."""
-    for player in players_list:
-        file = expected_player_data / "original" / player.id / "relatives.json"
-        expected_dict = json.loads(file.read_bytes())
-        assert player.relatives == expected_dict
+    expected_dict = read_expected_json(expected_dir / "relatives.json")
+    assert player.relatives == expected_dict
 
 
-def test_teams(expected_player_data: Path, players_list: list[br.Player]) -> None:
+def test_teams(expected_dir: Path, player: br.Player) -> None:
     """Tests the contents of the `teams` list."""
-    for player in players_list:
-        file = expected_player_data / "original" / player.id / "teams.json"
-        expected_list = json.loads(file.read_bytes())
-        assert player.teams == expected_list
+    expected_list = read_expected_json(expected_dir / "teams.json")
+    assert player.teams == expected_list
@@ -2,17 +2,15 @@
 
 import pandas as pd
 import pytest
-from get_expected import get_expected_df, get_expected_list
+from get_expected import (
+    PLAYER_TABLE_DTYPES,
+    PLAYER_UPDATED_TABLES,
+    get_expected_df,
+    get_expected_list,
+    table_cases,
+)
 
 import brlib as br
-from brlib._helpers.constants import (
-    PLAYER_BATTING_DTYPES,
-    PLAYER_BLING_DTYPES,
-    PLAYER_FIELDING_DTYPES,
-    PLAYER_INFO_DTYPES,
-    PLAYER_PITCHING_DTYPES,
-    PLAYER_SALARIES_DTYPES,
-)
 
 
 def test_empty_rejection() -> None:
@@ -31,46 +29,18 @@ def test_dunders(players_list: list[br.Player], player_set: br.PlayerSet) -> Non
     )  # single quotes for <3.12 support
 
 
-def test_info(player_set: br.PlayerSet, updated_player_set: br.PlayerSet) -> None:
-    """Tests the contents of the `info` DataFrame."""
-    expected_df = get_expected_df("players", "info", False, PLAYER_INFO_DTYPES)
-    pd.testing.assert_frame_equal(player_set.info, expected_df)
-
-    expected_df = get_expected_df("players", "info", True, PLAYER_INFO_DTYPES)
-    pd.testing.assert_frame_equal(updated_player_set.info, expected_df)
-
-
-def test_bling(player_set: br.PlayerSet) -> None:
-    """Tests the contents of the `bling` DataFrame."""
-    expected_df = get_expected_df("players", "bling", False, PLAYER_BLING_DTYPES)
-    pd.testing.assert_frame_equal(player_set.bling, expected_df)
-
-
-def test_batting(player_set: br.PlayerSet) -> None:
-    """Tests the contents of the `batting` DataFrame."""
-    expected_df = get_expected_df("players", "batting", False, PLAYER_BATTING_DTYPES)
-    pd.testing.assert_frame_equal(player_set.batting, expected_df)
-
-
-def test_pitching(player_set: br.PlayerSet, updated_player_set: br.PlayerSet) -> None:
-    """Tests the contents of the `pitching` DataFrame."""
-    expected_df = get_expected_df("players", "pitching", False, PLAYER_PITCHING_DTYPES)
-    pd.testing.assert_frame_equal(player_set.pitching, expected_df)
-
-    expected_df = get_expected_df("players", "pitching", True, PLAYER_PITCHING_DTYPES)
-    pd.testing.assert_frame_equal(updated_player_set.pitching, expected_df)
-
-
-def test_fielding(player_set: br.PlayerSet) -> None:
-    """Tests the contents of the `fielding` DataFrame."""
-    expected_df = get_expected_df("players", "fielding", False, PLAYER_FIELDING_DTYPES)
-    pd.testing.assert_frame_equal(player_set.fielding, expected_df)
-
-
-def test_salaries(player_set: br.PlayerSet, updated_player_set: br.PlayerSet) -> None:
-    """Tests the contents of the `salaries` DataFrame."""
-    expected_df = get_expected_df("players", "salaries", False, PLAYER_SALARIES_DTYPES)
-    pd.testing.assert_frame_equal(player_set.salaries, expected_df)
+@pytest.mark.parametrize(
+    ("version", "table"), table_cases(PLAYER_TABLE_DTYPES, PLAYER_UPDATED_TABLES)
+)
+def test_tables(
+    version: str, table: str, player_set: br.PlayerSet, updated_player_set: br.PlayerSet
+) -> None:
+    """Tests the contents of the DataFrame attributes."""
+    tested_set = updated_player_set if version == "updated" else player_set
+    expected_df = get_expected_df(
+        "players", table, version == "updated", PLAYER_TABLE_DTYPES[table]
+    )
+    pd.testing.assert_frame_equal(getattr(tested_set, table), expected_df)
 
 
 def test_teams(player_set: br.PlayerSet) -> None:
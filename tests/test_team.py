@@ -1,95 +1,81 @@
 """Tests the attributes and methods of the `Team` class."""
 
-import json
 from pathlib import Path
 
 import pandas as pd
+import pytest
+from case_ids import team_test_cases
+from get_expected import (
+    TEAM_TABLE_DTYPES,
+    TEAM_UPDATED_TABLES,
+    read_expected_csv,
+    read_expected_json,
+    table_cases,
+)
 
 import brlib as br
-from brlib._helpers.constants import (
-    TEAM_BATTING_DTYPES,
-    TEAM_BLING_DTYPES,
-    TEAM_FIELDING_DTYPES,
-    TEAM_INFO_DTYPES,
-    TEAM_PITCHING_DTYPES,
-)
+from brlib._helpers.constants import TEAM_PITCHING_DTYPES
+from brlib._helpers.no_hitter_dicts import nhd
+
+# runs a test against the outputs from both before and after the public methods are run
+both_versions = pytest.mark.parametrize("version", ["original", "updated"])
+
+
+@pytest.fixture(params=team_test_cases)
+def team(
+    request: pytest.FixtureRequest,
+    version: str,
+    teams_by_id: dict[str, dict[str, br.Team]],
+) -> br.Team:
+    """The `Team` output being tested."""
+    return teams_by_id[version][request.param]
+
+
+@pytest.fixture
+def expected_dir(expected_team_data: Path, version: str, team: br.Team) -> Path:
+    """The directory containing the expected outputs for `team`."""
+    return expected_team_data / version / team.id
+
+
+@pytest.mark.parametrize(("version", "table"), table_cases(TEAM_TABLE_DTYPES, TEAM_UPDATED_TABLES))
+def test_tables(expected_dir: Path, table: str, team: br.Team) -> None:
+    """Tests the contents of the DataFrame attributes."""
+    expected_df = read_expected_csv(expected_dir / f"{table}.csv", TEAM_TABLE_DTYPES[table])
+    pd.testing.assert_frame_equal(getattr(team, table), expected_df)
+
+
+@both_versions
+def test_name(team: br.Team) -> None:
+    """Tests that the `name` attribute matches the `info` DataFrame."""
+    assert f'{team.info["Season"].iloc[0]} {team.info["Team"].iloc[0]}' == team.name
 
 
-def test_info(
-    expected_team_data: Path,
-    teams_list: list[br.Team],
-    updated_teams_list: list[br.Team],
-) -> None:
-    """Tests the contents of the `info` DataFrame."""
-    for team in teams_list:
-        file = expected_team_data / "original" / team.id / "info.csv"
-        expected_df = pd.read_csv(file, dtype=TEAM_INFO_DTYPES)
-        pd.testing.assert_frame_equal(team.info, expected_df)
-        assert f'{team.info["Season"].iloc[0]} {team.info["Team"].iloc[0]}' == team.name
-
-    for team in updated_teams_list:
-        file = expected_team_data / "updated" / team.id / "info.csv"
-        expected_df = pd.read_csv(file, dtype=TEAM_INFO_DTYPES)
-        pd.testing.assert_frame_equal(team.info, expected_df)
-        assert f'{team.info["Season"].iloc[0]} {team.info["Team"].iloc[0]}' == team.name
-
-
-def test_bling(
-    expected_team_data: Path,
-    teams_list: list[br.Team],
-    updated_teams_list: list[br.Team],
-) -> None:
-    """Tests the contents of the `bling` DataFrame."""
-    for team in teams_list:
-        file = expected_team_data / "original" / team.id / "bling.csv"
-        expected_df = pd.read_csv(file, dtype=TEAM_BLING_DTYPES)
-        pd.testing.assert_frame_equal(team.bling, expected_df)
-
-
-def test_batting(
-    expected_team_data: Path,
-    teams_list: list[br.Team],
-    updated_teams_list: list[br.Team],
-) -> None:
-    """Tests the contents of the `batting` DataFrame."""
-    for team in teams_list:
-        file = expected_team_data / "original" / team.id / "batting.csv"
-        expected_df = pd.read_csv(file, dtype=TEAM_BATTING_DTYPES)
-        pd.testing.assert_frame_equal(team.batting, expected_df)
-
-
-def test_pitching(
-    expected_team_data: Path,
-    teams_list: list[br.Team],
-    updated_teams_list: list[br.Team],
-) -> None:
-    """Tests the contents of the `pitching` DataFrame."""
-    for team in teams_list:
-        file = expected_team_data / "original" / team.id / "pitching.csv"
-        expected_df = pd.read_csv(file, dtype=TEAM_PITCHING_DTYPES)
-        pd.testing.assert_frame_equal(team.pitching, expected_df)
-
-    for team in updated_teams_list:
-        file = expected_team_data / "updated" / team.id / "pitching.csv"
-        expected_df = pd.read_csv(file, dtype=TEAM_PITCHING_DTYPES)
-        pd.testing.assert_frame_equal(team.pitching, expected_df)
-
-
-def test_fielding(
-    expected_team_data: Path,
-    teams_list: list[br.Team],
-    updated_teams_list: list[br.Team],
-) -> None:
-    """Tests the contents of the `fielding` DataFrame."""
-    for team in teams_list:
-        file = expected_team_data / "original" / team.id / "fielding.csv"
-        expected_df = pd.read_csv(file, dtype=TEAM_FIELDING_DTYPES)
-        pd.testing.assert_frame_equal(team.fielding, expected_df)
-
-
-def test_players(expected_team_data: Path, teams_list: list[br.Team]) -> None:
+def test_players(expected_dir: Path, team: br.Team) -> None:
     """Tests the contents of the `players` list."""
-    for team in teams_list:
-        file = expected_team_data / "original" / team.id / "players.json"
-        expected_list = json.loads(file.read_bytes())
-        assert team.players == expected_list
+    expected_list = read_expected_json(expected_dir / "players.json")
+    assert team.players == expected_list
+
+
+def test_add_no_hitters_one_row(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Tests that `add_no_hitters` works when the `pitching` DataFrame has one row."""
+    monkeypatch.setattr(nhd, "_populated", True)
+    monkeypatch.setattr(nhd, "team_inh_dict", {"BOS1904": [["youngcy01", "R"]]})
+    monkeypatch.setattr(nhd, "team_pg_dict", {"BOS1904": [["youngcy01", "R"]]})
+    monkeypatch.setattr(nhd, "team_cnh_dict", {})
+
+    team = br.Team.__new__(br.Team)
+    team.id = "BOS1904"
+    pitching = pd.DataFrame(
+        {
+            "Player": ["Team Totals"],
+            "Player ID": [pd.NA],
+            "Game Type": ["Regular Season"],
+            "NH": [0],
+            "PG": [0],
+            "CNH": [0],
+        }
+    )
+    team.pitching = pitching.astype({col: TEAM_PITCHING_DTYPES[col] for col in pitching.columns})
+    team.add_no_hitters()
+    assert team.pitching[["NH", "PG", "CNH"]].iloc[0].tolist() == [1, 1, 0]
+    assert (team.pitching[["NH", "PG", "CNH"]].dtypes == "Int64").all()
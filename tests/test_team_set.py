@@ -4,17 +4,17 @@ from pathlib import Path
 
 import pandas as pd
 import pytest
-from get_expected import get_expected_df, get_expected_list
+from get_expected import (
+    TEAM_TABLE_DTYPES,
+    TEAM_UPDATED_TABLES,
+    get_expected_df,
+    get_expected_list,
+    read_expected_csv,
+    table_cases,
+)
 
 import brlib as br
-from brlib._helpers.constants import (
-    RECORDS_DTYPES,
-    TEAM_BATTING_DTYPES,
-    TEAM_BLING_DTYPES,
-    TEAM_FIELDING_DTYPES,
-    TEAM_INFO_DTYPES,
-    TEAM_PITCHING_DTYPES,
-)
+from brlib._helpers.constants import RECORDS_DTYPES
 
 
 def test_empty_rejection() -> None:
@@ -31,46 +31,20 @@ def test_dunders(teams_list: list[br.Team], team_set: br.TeamSet) -> None:
     assert repr(team_set) == f'TeamSet({", ".join(team_reprs)})'  # single quotes for <3.12 support
 
 
-def test_info(team_set: br.TeamSet, updated_team_set: br.TeamSet) -> None:
-    """Tests the contents of the `info` DataFrame."""
-    expected_df = get_expected_df("teams", "info", False, TEAM_INFO_DTYPES)
-    pd.testing.assert_frame_equal(team_set.info, expected_df)
-
-    expected_df = get_expected_df("teams", "info", True, TEAM_INFO_DTYPES)
-    pd.testing.assert_frame_equal(updated_team_set.info, expected_df)
-
-
-def test_bling(team_set: br.TeamSet, updated_team_set: br.TeamSet) -> None:
-    """Tests the contents of the `bling` DataFrame."""
-    expected_df = get_expected_df("teams", "bling", False, TEAM_BLING_DTYPES)
-    pd.testing.assert_frame_equal(team_set.bling, expected_df)
-
-
-def test_batting(team_set: br.TeamSet, updated_team_set: br.TeamSet) -> None:
-    """Tests the contents of the `batting` DataFrame."""
-    expected_df = get_expected_df("teams", "batting", False, TEAM_BATTING_DTYPES)
-    pd.testing.assert_frame_equal(team_set.batting, expected_df)
-
-
-def test_pitching(team_set: br.TeamSet, updated_team_set: br.TeamSet) -> None:
-    """Tests the contents of the `pitching` DataFrame."""
-    expected_df = get_expected_df("teams", "pitching", False, TEAM_PITCHING_DTYPES)
-    pd.testing.assert_frame_equal(team_set.pitching, expected_df)
-
-    expected_df = get_expected_df("teams", "pitching", True, TEAM_PITCHING_DTYPES)
-    pd.testing.assert_frame_equal(updated_team_set.pitching, expected_df)
-
-
-def test_fielding(team_set: br.TeamSet, updated_team_set: br.TeamSet) -> None:
-    """Tests the contents of the `fielding` DataFrame."""
-    expected_df = get_expected_df("teams", "fielding", False, TEAM_FIELDING_DTYPES)
-    pd.testing.assert_frame_equal(team_set.fielding, expected_df)
+@pytest.mark.parametrize(("version", "table"), table_cases(TEAM_TABLE_DTYPES, TEAM_UPDATED_TABLES))
+def test_tables(
+    version: str, table: str, team_set: br.TeamSet, updated_team_set: br.TeamSet
+) -> None:
+    """Tests the contents of the DataFrame attributes."""
+    tested_set = updated_team_set if version == "updated" else team_set
+    expected_df = get_expected_df("teams", table, version == "updated", TEAM_TABLE_DTYPES[table])
+    pd.testing.assert_frame_equal(getattr(tested_set, table), expected_df)
 
 
 def test_records(expected_team_data: Path, team_set: br.TeamSet) -> None:
     """Tests the contents of the `records` DataFrame."""
     file = expected_team_data / "records.csv"
-    expected_df = pd.read_csv(file, dtype=RECORDS_DTYPES)
+    expected_df = read_expected_csv(file, RECORDS_DTYPES)
     pd.testing.assert_frame_equal(team_set.records, expected_df)
 
 